@@ -0,0 +1,63 @@
+"""
+Cached exchange capability data for `dexcli info`.
+
+The first `info` run for an exchange builds a client and saves its name,
+version and ccxt `has` map under ~/.cache/dexcli/capabilities/, keyed by the
+installed ccxt version. Later runs answer from that file without importing
+ccxt; upgrading ccxt changes the key, so the data is regenerated.
+"""
+
+import json
+import os
+from typing import Optional, Dict, Any
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dexcli', 'capabilities')
+
+
+def _installed_ccxt_version() -> Optional[str]:
+    """Installed ccxt version, read from package metadata without importing ccxt"""
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        return version('ccxt')
+    except PackageNotFoundError:
+        return None
+
+
+def _path(exchange_name: str, ccxt_version: str) -> str:
+    return os.path.join(CACHE_DIR, f"{exchange_name}-{ccxt_version}.json")
+
+
+def load(exchange_name: str) -> Optional[Dict[str, Any]]:
+    """Load cached capabilities for the installed ccxt version, or None"""
+    ccxt_version = _installed_ccxt_version()
+    if ccxt_version is None:
+        return None
+    try:
+        with open(_path(exchange_name, ccxt_version), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save(exchange_name: str, exchange: Any):
+    """Cache the capabilities of a live exchange (best effort)"""
+    ccxt_version = _installed_ccxt_version()
+    if ccxt_version is None:
+        return
+    path = _path(exchange_name, ccxt_version)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'name': exchange.name,
+                'version': exchange.version,
+                'has': exchange.has,
+            }, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
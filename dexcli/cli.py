@@ -4,29 +4,113 @@ dexcli - DEX Command Line Interface
 A command-line interface for trading on decentralized exchanges using ccxt.
 """
 
-import ccxt
 import click
-import json
 import sys
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-from tabulate import tabulate
+from typing import Optional, Dict, Any, List, Union
 import os
-from dotenv import load_dotenv
+from datetime import datetime
+
+# Heavy dependencies (ccxt, tabulate, dotenv, orjson) are imported
+# inside the functions that use them so that `--help` and argument errors
+# don't pay their import cost.
+
+DEFAULT_EXCHANGE = 'hyperliquid'
+
+# Shared constant dicts, so hot paths don't rebuild them per call
+_HL_OPTIONS = {'defaultType': 'swap'}  # Use perpetual futures
+_REDUCE_ONLY = ({'reduceOnly': False}, {'reduceOnly': True})
+# Order side that closes a position of the given side
+_OPPOSITE_SIDE = {'long': 'sell', 'short': 'buy'}
+
+# Maximum number of concurrent requests for multi-symbol queries
+DEFAULT_CONCURRENCY = 4
+
+# On-disk markets cache (one file per exchange), refreshed after the TTL expires
+MARKETS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'dexcli')
+DEFAULT_MARKETS_TTL = 600  # seconds
+# Cache file layout: format version byte, SHA-256 of the ccxt version, pickle
+MARKETS_CACHE_FORMAT = 2
+# Exchange options filled in while loading markets, cached alongside them
+# (in addition to the exchange's own options['marketHelperProps'])
+_MARKET_STATE_OPTIONS = ('spotCurrencyMapping',)
 
-# Load environment variables
-load_dotenv()
+_dotenv_loaded = False
+
+def _load_dotenv():
+    """Load the .env file once per process (skip with DEXCLI_SKIP_DOTENV=1)"""
+    global _dotenv_loaded
+    if _dotenv_loaded or os.getenv('DEXCLI_SKIP_DOTENV'):
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _dotenv_loaded = True
+
+def _env_flag(name: str) -> bool:
+    """True when an environment variable is set to 1/true/yes"""
+    return os.getenv(name, '').strip().lower() in ('1', 'true', 'yes')
+
+def _concurrency_limit() -> int:
+    """Read DEXCLI_CONCURRENCY, clamped to at least 1 so fan-out always progresses"""
+    value = os.getenv('DEXCLI_CONCURRENCY', str(DEFAULT_CONCURRENCY))
+    try:
+        return max(1, int(value))
+    except ValueError:
+        raise ValueError(f"DEXCLI_CONCURRENCY must be an integer, got '{value}'")
+
+def _dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is available"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return json.dumps(obj, indent=2, default=str)
+    return orjson.dumps(obj, default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+def _echo_json(obj: Any):
+    """Write obj as indented JSON to stdout, straight from bytes when orjson is available"""
+    try:
+        import orjson
+    except ImportError:
+        click.echo(_dumps(obj))
+        return
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(orjson.dumps(obj, default=str,
+                           option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+    out.flush()
+
+_fromtimestamp = datetime.fromtimestamp
+
+def _fmt_ts(ms: float) -> str:
+    """Format a millisecond timestamp as local 'YYYY-MM-DD HH:MM:SS'"""
+    # isoformat skips strftime's per-call format string parsing
+    return _fromtimestamp(ms * 1e-3).isoformat(sep=' ', timespec='seconds')
 
 class DEXCLIClient:
     """Main client for interacting with the exchange"""
     
-    def __init__(self, exchange_name: str = 'hyperliquid'):
+    def __init__(self, exchange_name: str = DEFAULT_EXCHANGE,
+                 enable_rate_limit: Optional[bool] = None):
         self.exchange_name = exchange_name
+        self.enable_rate_limit = enable_rate_limit
         self.exchange = None
+        self._markets_by_symbol: Optional[Dict[str, Dict[str, Any]]] = None
+        self._positions_by_symbol: Optional[Dict[str, Dict[str, Any]]] = None
+        self._markets_from_cache = False
         self._initialize_exchange()
     
     def _initialize_exchange(self):
         """Initialize the exchange connection"""
+        import ccxt
+
+        # Load environment variables (skip with DEXCLI_SKIP_DOTENV=1)
+        _load_dotenv()
+
+        # Client-side throttling; the exchange still enforces its limits server-side
+        if self.enable_rate_limit is None:
+            self.enable_rate_limit = not _env_flag('DEXCLI_DISABLE_RATELIMIT')
+
         try:
             # Get credentials from environment variables
             api_key = os.getenv('DEXCLI_API_KEY', '')
@@ -37,24 +121,96 @@ class DEXCLIClient:
             self.exchange = exchange_class({
                 'apiKey': api_key,
                 'secret': api_secret,
-                'enableRateLimit': True,
+                'enableRateLimit': self.enable_rate_limit,
             })
             
             # For Hyperliquid specific configurations
             if self.exchange_name == 'hyperliquid':
-                self.exchange.options = {
-                    'defaultType': 'swap',  # Use perpetual futures
-                }
+                # Merged so ccxt's own defaults (spotCurrencyMapping, ...) survive
+                self.exchange.options.update(_HL_OPTIONS)
                 
         except AttributeError:
             raise ValueError(f"Exchange '{self.exchange_name}' not supported by ccxt")
         except Exception as e:
             raise RuntimeError(f"Failed to initialize exchange: {str(e)}")
     
+    def _ensure_markets(self):
+        """Load markets (from the disk cache when fresh) on first use"""
+        if not self.exchange.markets:
+            self._load_markets_cached()
+    
+    def _markets_cache_path(self) -> str:
+        """Path of the markets cache file for this exchange"""
+        return os.path.join(MARKETS_CACHE_DIR, f"{self.exchange_name}_markets.pickle")
+    
+    def _market_state_keys(self) -> List[str]:
+        """Option keys holding state built while loading markets"""
+        helpers = self.exchange.options.get('marketHelperProps') or []
+        return [*helpers, *_MARKET_STATE_OPTIONS]
+    
+    def _load_markets_cached(self, reload: bool = False) -> Dict[str, Any]:
+        """Load markets from the disk cache, fetching them only when stale (or reload)"""
+        import ccxt
+        import hashlib
+        import pickle
+        import time
+
+        # Any (re)load invalidates the symbol index built from the old markets
+        self._markets_by_symbol = None
+        path = self._markets_cache_path()
+        ttl = float(os.getenv('DEXCLI_MARKETS_TTL', DEFAULT_MARKETS_TTL))
+        # Market shapes can change across ccxt releases, so key the cache on its version
+        header = bytes([MARKETS_CACHE_FORMAT]) + hashlib.sha256(ccxt.__version__.encode()).digest()
+
+        # Serve from cache when the file is fresh enough and was written by
+        # this cache format and ccxt version
+        try:
+            if not reload and time.time() - os.path.getmtime(path) < ttl:
+                with open(path, 'rb') as f:
+                    if f.read(len(header)) == header:
+                        cached = pickle.load(f)
+                        self.exchange.set_markets(cached['markets'], cached.get('currencies'))
+                        # Restore helper state, as ccxt's set_markets_from_exchange does
+                        self.exchange.options.update(cached['options'])
+                        self._markets_from_cache = True
+                        return self.exchange.markets
+        except Exception:
+            # Missing or corrupt cache (a damaged pickle can raise almost
+            # anything); fall through to a fresh fetch, which rewrites it
+            pass
+
+        try:
+            markets = self.exchange.load_markets(reload=True)
+        except Exception as e:
+            raise RuntimeError(f"Failed to load markets: {str(e)}")
+        self._markets_from_cache = False
+
+        # Write atomically so concurrent invocations never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(MARKETS_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                pickle.dump({
+                    'markets': list(markets.values()),
+                    'currencies': self.exchange.currencies,
+                    'options': {k: self.exchange.options[k]
+                                for k in self._market_state_keys() if k in self.exchange.options},
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PicklingError):
+            # Caching is best effort; don't leave a partial temp file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return markets
+    
     def create_order(self, symbol: str, side: str, order_type: str, amount: float, 
                     price: Optional[float] = None) -> Dict[str, Any]:
         """Create a new order"""
         try:
+            self._ensure_markets()
             if order_type == 'limit' and price is None:
                 raise ValueError("Price is required for limit orders")
             
@@ -72,6 +228,7 @@ class DEXCLIClient:
     def cancel_order(self, order_id: str, symbol: str) -> Dict[str, Any]:
         """Cancel an existing order"""
         try:
+            self._ensure_markets()
             result = self.exchange.cancel_order(order_id, symbol)
             return result
         except Exception as e:
@@ -80,6 +237,7 @@ class DEXCLIClient:
     def get_order_status(self, order_id: str, symbol: str) -> Dict[str, Any]:
         """Get the status of a specific order"""
         try:
+            self._ensure_markets()
             order = self.exchange.fetch_order(order_id, symbol)
             return order
         except Exception as e:
@@ -88,6 +246,7 @@ class DEXCLIClient:
     def list_orders(self, symbol: Optional[str] = None, status: str = 'open') -> List[Dict[str, Any]]:
         """List orders with optional filtering"""
         try:
+            self._ensure_markets()
             if status == 'open':
                 orders = self.exchange.fetch_open_orders(symbol)
             elif status == 'closed':
@@ -98,25 +257,134 @@ class DEXCLIClient:
         except Exception as e:
             raise RuntimeError(f"Failed to fetch orders: {str(e)}")
     
+    def fetch_orders_for_symbols(self, symbols: List[str], status: str = 'open') -> List[Dict[str, Any]]:
+        """List orders for several symbols concurrently"""
+        import asyncio
+
+        try:
+            self._ensure_markets()
+            return asyncio.run(self._fetch_orders_for_symbols(symbols, status))
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch orders: {str(e)}")
+    
+    def _build_async_exchange(self):
+        """Build an async twin of the sync exchange with the same settings"""
+        import ccxt.async_support as ccxt_async
+
+        exchange_class = getattr(ccxt_async, self.exchange_name)
+        ex = exchange_class({
+            'apiKey': self.exchange.apiKey,
+            'secret': self.exchange.secret,
+            'enableRateLimit': self.exchange.enableRateLimit,
+        })
+        ex.options = dict(self.exchange.options)
+        # Reuse the markets already loaded by the sync client
+        ex.set_markets(list(self.exchange.markets.values()), self.exchange.currencies)
+        return ex
+    
+    async def _fetch_orders_for_symbols(self, symbols: List[str], status: str) -> List[Dict[str, Any]]:
+        """Fan out order queries over an async exchange, bounded by DEXCLI_CONCURRENCY"""
+        import asyncio
+
+        # Validate the limit before opening any connections
+        semaphore = asyncio.Semaphore(_concurrency_limit())
+        ex = self._build_async_exchange()
+        if status == 'open':
+            fetch_method = ex.fetch_open_orders
+        elif status == 'closed':
+            fetch_method = ex.fetch_closed_orders
+        else:
+            fetch_method = ex.fetch_orders
+
+        async def fetch(sym):
+            async with semaphore:
+                return await fetch_method(sym)
+
+        try:
+            results = await asyncio.gather(*[fetch(s) for s in symbols])
+        finally:
+            await ex.close()
+        return [order for orders in results for order in orders]
+    
     def get_positions(self) -> List[Dict[str, Any]]:
         """Get all open positions"""
         try:
+            self._ensure_markets()
             positions = self.exchange.fetch_positions()
+            self._index_positions(positions)
             return positions
         except Exception as e:
             raise RuntimeError(f"Failed to fetch positions: {str(e)}")
     
-    def close_position(self, symbol: str, reduce_only: bool = True) -> Dict[str, Any]:
-        """Close a position by creating a counter order"""
+    def _index_positions(self, positions: List[Dict[str, Any]]):
+        """Rebuild the symbol index of open positions"""
+        self._positions_by_symbol = {p['symbol']: p for p in positions if p['contracts'] != 0}
+    
+    def fetch_state(self) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """Get positions and open orders together
+        
+        Both requests are issued concurrently, so the pair costs about one
+        round-trip. 'orders' is None when the exchange can't list open orders
+        without a symbol; any other failure is raised.
+        """
+        import asyncio
+        import ccxt
+
+        if not self.exchange.has.get('fetchOpenOrders'):
+            return {'positions': self.get_positions(), 'orders': None}
         try:
-            # Fetch current position
-            positions = self.exchange.fetch_positions([symbol])
-            if not positions:
-                raise ValueError(f"No open position found for {symbol}")
+            self._ensure_markets()
+            positions, orders = asyncio.run(self._fetch_state())
+            if isinstance(positions, Exception):
+                raise positions
+            if isinstance(orders, (ccxt.NotSupported, ccxt.ArgumentsRequired)):
+                orders = None
+            elif isinstance(orders, Exception):
+                raise orders
+        except Exception as e:
+            raise RuntimeError(f"Failed to fetch account state: {str(e)}")
+        self._index_positions(positions)
+        return {'positions': positions, 'orders': orders}
+    
+    async def _fetch_state(self):
+        """Fetch positions and open orders concurrently, returning errors in place"""
+        import asyncio
+
+        ex = self._build_async_exchange()
+        try:
+            return await asyncio.gather(ex.fetch_positions(), ex.fetch_open_orders(),
+                                        return_exceptions=True)
+        finally:
+            await ex.close()
+    
+    def get_position(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get the open position for a symbol, fetching positions on first use"""
+        if self._positions_by_symbol is None:
+            self.get_positions()
+        return self._positions_by_symbol.get(symbol)
+    
+    def close_position(self, position: Union[Dict[str, Any], str],
+                       reduce_only: bool = True) -> Dict[str, Any]:
+        """Close a position by creating a counter order
+        
+        Takes an already-fetched position; a bare symbol is still accepted
+        and costs an extra fetch_positions round-trip.
+        """
+        try:
+            self._ensure_markets()
+            if isinstance(position, str):
+                symbol = position
+                positions = self.exchange.fetch_positions([symbol])
+                if not positions:
+                    raise ValueError(f"No open position found for {symbol}")
+                position = positions[0]
+            symbol = position['symbol']
             
-            position = positions[0]
             contracts = abs(position['contracts'])
-            side = 'sell' if position['side'] == 'long' else 'buy'
+            try:
+                side = _OPPOSITE_SIDE[position['side']]
+            except KeyError:
+                raise ValueError(f"Unknown position side: {position['side']}")
             
             # Create market order to close position
             order = self.exchange.create_order(
@@ -124,7 +392,7 @@ class DEXCLIClient:
                 type='market',
                 side=side,
                 amount=contracts,
-                params={'reduceOnly': reduce_only}
+                params=_REDUCE_ONLY[bool(reduce_only)]
             )
             return order
         except Exception as e:
@@ -133,6 +401,7 @@ class DEXCLIClient:
     def get_open_orders(self, symbol: str) -> List[Dict[str, Any]]:
         """Get open orders for a specific symbol"""
         try:
+            self._ensure_markets()
             orders = self.exchange.fetch_open_orders(symbol)
             return orders
         except Exception as e:
@@ -141,18 +410,70 @@ class DEXCLIClient:
     def list_markets(self) -> List[Dict[str, Any]]:
         """List all available markets"""
         try:
-            markets = self.exchange.fetch_markets()
+            markets = list(self.markets_by_symbol.values())
             return markets
         except Exception as e:
             raise RuntimeError(f"Failed to fetch markets: {str(e)}")
+    
+    @property
+    def markets_by_symbol(self) -> Dict[str, Dict[str, Any]]:
+        """Loaded markets indexed by symbol"""
+        if self._markets_by_symbol is None:
+            self._ensure_markets()
+            self._markets_by_symbol = self.exchange.markets
+        return self._markets_by_symbol
+    
+    def get_market(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Resolve a unified symbol or exchange market id
+        
+        Answered from the loaded markets. If those came from the disk cache,
+        a miss reloads them from the exchange once, in case the cache predates
+        a new listing; errors from that reload are raised, not treated as a miss.
+        """
+        import ccxt
+
+        market = self.markets_by_symbol.get(symbol)
+        if market is not None:
+            return market
+        try:
+            # Also resolves exchange market ids through markets_by_id
+            return self.exchange.market(symbol)
+        except ccxt.BadSymbol:
+            pass
+        if not self._markets_from_cache:
+            return None
+        self._load_markets_cached(reload=True)
+        try:
+            return self.exchange.market(symbol)
+        except ccxt.BadSymbol:
+            return None
+
+def _get_client(ctx) -> DEXCLIClient:
+    """Build the exchange client on first use and reuse it afterwards"""
+    if 'client' not in ctx.obj:
+        ctx.obj['client'] = DEXCLIClient(ctx.obj.get('exchange_name', DEFAULT_EXCHANGE),
+                                         enable_rate_limit=ctx.obj.get('enable_rate_limit'))
+    return ctx.obj['client']
 
 # CLI Commands
 @click.group()
+@click.option('--exchange', '-e', default=DEFAULT_EXCHANGE, envvar='DEXCLI_EXCHANGE',
+              show_default=True, help='ccxt exchange id')
+@click.option('--no-rate-limit', is_flag=True,
+              help='Disable client-side rate limiting (also DEXCLI_DISABLE_RATELIMIT=1)')
 @click.pass_context
-def cli(ctx):
+def cli(ctx, exchange, no_rate_limit):
     """dexcli - DEX Command Line Interface"""
     ctx.ensure_object(dict)
-    ctx.obj['client'] = DEXCLIClient()
+    # Click resolved --exchange before .env was loaded, so pick up a
+    # DEXCLI_EXCHANGE set there unless the option was given explicitly
+    _load_dotenv()
+    if ctx.get_parameter_source('exchange') == click.core.ParameterSource.DEFAULT:
+        exchange = os.getenv('DEXCLI_EXCHANGE', exchange)
+    # The client is only built once a subcommand actually needs it
+    ctx.obj['exchange_name'] = exchange
+    if no_rate_limit:
+        ctx.obj['enable_rate_limit'] = False
 
 @cli.command()
 @click.option('--symbol', '-s', required=True, help='Trading symbol (e.g., BTC/USDT)')
@@ -163,13 +484,17 @@ def cli(ctx):
 @click.pass_context
 def create(ctx, symbol, side, type, amount, price):
     """Create a new order"""
-    client = ctx.obj['client']
     try:
+        client = _get_client(ctx)
+        if client.get_market(symbol) is None:
+            raise ValueError(f"Unknown symbol: {symbol}")
         order = client.create_order(symbol, side, type, amount, price)
-        click.echo(f"Order created successfully!")
-        click.echo(f"Order ID: {order['id']}")
-        click.echo(f"Status: {order['status']}")
-        click.echo(json.dumps(order, indent=2))
+        click.echo('\n'.join([
+            "Order created successfully!",
+            f"Order ID: {order['id']}",
+            f"Status: {order['status']}",
+            _dumps(order),
+        ]))
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -180,11 +505,10 @@ def create(ctx, symbol, side, type, amount, price):
 @click.pass_context
 def cancel(ctx, order_id, symbol):
     """Cancel an existing order"""
-    client = ctx.obj['client']
     try:
+        client = _get_client(ctx)
         result = client.cancel_order(order_id, symbol)
-        click.echo(f"Order {order_id} cancelled successfully!")
-        click.echo(json.dumps(result, indent=2))
+        click.echo(f"Order {order_id} cancelled successfully!\n{_dumps(result)}")
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -195,44 +519,51 @@ def cancel(ctx, order_id, symbol):
 @click.pass_context
 def status(ctx, order_id, symbol):
     """Get the status of a specific order"""
-    client = ctx.obj['client']
     try:
+        client = _get_client(ctx)
         order = client.get_order_status(order_id, symbol)
-        click.echo(f"Order Status: {order['status']}")
-        click.echo(f"Type: {order['type']}")
-        click.echo(f"Side: {order['side']}")
-        click.echo(f"Amount: {order['amount']}")
-        click.echo(f"Filled: {order['filled']}")
+        lines = [
+            f"Order Status: {order['status']}",
+            f"Type: {order['type']}",
+            f"Side: {order['side']}",
+            f"Amount: {order['amount']}",
+            f"Filled: {order['filled']}",
+        ]
         if order.get('price'):
-            click.echo(f"Price: {order['price']}")
-        click.echo(f"Created: {datetime.fromtimestamp(order['timestamp']/1000).strftime('%Y-%m-%d %H:%M:%S')}")
+            lines.append(f"Price: {order['price']}")
+        lines.append(f"Created: {_fmt_ts(order['timestamp'])}")
+        click.echo('\n'.join(lines))
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
 
 @cli.command()
-@click.option('--symbol', '-s', help='Filter by trading symbol')
+@click.option('--symbol', '-s', multiple=True, help='Filter by trading symbol (repeatable)')
 @click.option('--status', '-t', type=click.Choice(['open', 'closed', 'all']), default='open', help='Order status filter')
 @click.option('--format', '-f', type=click.Choice(['table', 'json']), default='table', help='Output format')
 @click.pass_context
 def orders(ctx, symbol, status, format):
     """List orders"""
-    client = ctx.obj['client']
     try:
-        orders_list = client.list_orders(symbol, status)
+        client = _get_client(ctx)
+        if len(symbol) > 1:
+            orders_list = client.fetch_orders_for_symbols(list(symbol), status)
+        else:
+            orders_list = client.list_orders(symbol[0] if symbol else None, status)
         
         if not orders_list:
             click.echo("No orders found.")
             return
         
         if format == 'json':
-            click.echo(json.dumps(orders_list, indent=2))
+            _echo_json(orders_list)
         else:
+            from tabulate import tabulate
+
             # Format as table
             headers = ['ID', 'Symbol', 'Type', 'Side', 'Amount', 'Filled', 'Price', 'Status', 'Created']
-            rows = []
-            for order in orders_list:
-                rows.append([
+            rows = (
+                [
                     order['id'][:8] + '...',
                     order['symbol'],
                     order['type'],
@@ -241,37 +572,55 @@ def orders(ctx, symbol, status, format):
                     f"{order['filled']:.4f}",
                     f"{order.get('price', 'N/A')}",
                     order['status'],
-                    datetime.fromtimestamp(order['timestamp']/1000).strftime('%Y-%m-%d %H:%M:%S')
-                ])
+                    _fmt_ts(order['timestamp'])
+                ]
+                for order in orders_list
+            )
             click.echo(tabulate(rows, headers=headers, tablefmt='grid'))
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
 
 @cli.command()
+@click.option('--orders', '-o', 'with_orders', is_flag=True, help='Also show open orders')
 @click.option('--format', '-f', type=click.Choice(['table', 'json']), default='table', help='Output format')
 @click.pass_context
-def positions(ctx, format):
+def positions(ctx, with_orders, format):
     """Show open positions"""
-    client = ctx.obj['client']
     try:
-        positions_list = client.get_positions()
+        client = _get_client(ctx)
+        if with_orders:
+            # Positions and open orders in one concurrent fetch
+            state = client.fetch_state()
+            positions_list, open_orders = state['positions'], state['orders']
+            if open_orders is None:
+                click.echo("Warning: open orders are not available from this exchange", err=True)
+        else:
+            positions_list, open_orders = client.get_positions(), None
         
         # Filter only open positions
         open_positions = [p for p in positions_list if p['contracts'] != 0]
         
-        if not open_positions:
+        if not open_positions and open_orders is None:
             click.echo("No open positions found.")
             return
         
         if format == 'json':
-            click.echo(json.dumps(open_positions, indent=2))
+            if with_orders:
+                _echo_json({'positions': open_positions, 'orders': open_orders})
+            else:
+                _echo_json(open_positions)
+            return
+        
+        from tabulate import tabulate
+
+        if not open_positions:
+            click.echo("No open positions found.")
         else:
             # Format as table
             headers = ['Symbol', 'Side', 'Contracts', 'Avg Price', 'Mark Price', 'PnL', 'PnL %', 'Margin']
-            rows = []
-            for pos in open_positions:
-                rows.append([
+            rows = (
+                [
                     pos['symbol'],
                     pos['side'],
                     f"{pos['contracts']:.4f}",
@@ -280,7 +629,30 @@ def positions(ctx, format):
                     f"{pos.get('unrealizedPnl', 0):.2f}",
                     f"{pos.get('percentage', 0):.2f}%",
                     f"{pos.get('initialMargin', 0):.2f}"
-                ])
+                ]
+                for pos in open_positions
+            )
+            click.echo(tabulate(rows, headers=headers, tablefmt='grid'))
+        
+        if open_orders is not None:
+            if not open_orders:
+                click.echo("\nNo open orders found.")
+                return
+            headers = ['ID', 'Symbol', 'Type', 'Side', 'Amount', 'Filled', 'Price', 'Created']
+            rows = (
+                [
+                    order['id'][:12] + '...' if len(order['id']) > 12 else order['id'],
+                    order['symbol'],
+                    order['type'],
+                    order['side'],
+                    f"{order['amount']:.4f}",
+                    f"{order['filled']:.4f}",
+                    f"{order.get('price', 'N/A')}",
+                    _fmt_ts(order['timestamp'])
+                ]
+                for order in open_orders
+            )
+            click.echo("\nOpen orders:")
             click.echo(tabulate(rows, headers=headers, tablefmt='grid'))
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
@@ -292,22 +664,23 @@ def positions(ctx, format):
 @click.pass_context
 def close(ctx, symbol, confirm):
     """Close an open position"""
-    client = ctx.obj['client']
     try:
+        client = _get_client(ctx)
         # Get current position info
-        positions = client.get_positions()
-        position = next((p for p in positions if p['symbol'] == symbol and p['contracts'] != 0), None)
+        position = client.get_position(symbol)
         
         if not position:
             click.echo(f"No open position found for {symbol}")
             return
         
         # Show position details
-        click.echo(f"Position to close:")
-        click.echo(f"Symbol: {position['symbol']}")
-        click.echo(f"Side: {position['side']}")
-        click.echo(f"Contracts: {position['contracts']}")
-        click.echo(f"Unrealized PnL: {position.get('unrealizedPnl', 0):.2f}")
+        click.echo('\n'.join([
+            "Position to close:",
+            f"Symbol: {position['symbol']}",
+            f"Side: {position['side']}",
+            f"Contracts: {position['contracts']}",
+            f"Unrealized PnL: {position.get('unrealizedPnl', 0):.2f}",
+        ]))
         
         if not confirm:
             if not click.confirm("Are you sure you want to close this position?"):
@@ -315,10 +688,12 @@ def close(ctx, symbol, confirm):
                 return
         
         # Close the position
-        order = client.close_position(symbol)
-        click.echo(f"Position closed successfully!")
-        click.echo(f"Order ID: {order['id']}")
-        click.echo(f"Status: {order['status']}")
+        order = client.close_position(position, reduce_only=True)
+        click.echo('\n'.join([
+            "Position closed successfully!",
+            f"Order ID: {order['id']}",
+            f"Status: {order['status']}",
+        ]))
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -329,8 +704,8 @@ def close(ctx, symbol, confirm):
 @click.pass_context
 def get_open_orders(ctx, symbol, format):
     """Get open orders for a specific symbol"""
-    client = ctx.obj['client']
     try:
+        client = _get_client(ctx)
         orders_list = client.get_open_orders(symbol)
         
         if not orders_list:
@@ -338,13 +713,14 @@ def get_open_orders(ctx, symbol, format):
             return
         
         if format == 'json':
-            click.echo(json.dumps(orders_list, indent=2))
+            _echo_json(orders_list)
         else:
+            from tabulate import tabulate
+
             # Format as table
             headers = ['ID', 'Type', 'Side', 'Amount', 'Filled', 'Price', 'Status', 'Created']
-            rows = []
-            for order in orders_list:
-                rows.append([
+            rows = (
+                [
                     order['id'][:12] + '...' if len(order['id']) > 12 else order['id'],
                     order['type'],
                     order['side'],
@@ -352,8 +728,10 @@ def get_open_orders(ctx, symbol, format):
                     f"{order['filled']:.4f}",
                     f"{order.get('price', 'N/A')}",
                     order['status'],
-                    datetime.fromtimestamp(order['timestamp']/1000).strftime('%Y-%m-%d %H:%M:%S')
-                ])
+                    _fmt_ts(order['timestamp'])
+                ]
+                for order in orders_list
+            )
             click.echo(tabulate(rows, headers=headers, tablefmt='grid'))
             click.echo(f"\nTotal open orders: {len(orders_list)}")
     except Exception as e:
@@ -368,30 +746,39 @@ def get_open_orders(ctx, symbol, format):
 @click.pass_context
 def markets(ctx, active, type, quote, format):
     """List available markets"""
-    client = ctx.obj['client']
     try:
-        markets_list = client.list_markets()
+        client = _get_client(ctx)
+        all_markets = client.list_markets()
         
-        # Apply filters
-        if active:
-            markets_list = [m for m in markets_list if m.get('active', True)]
-        if type:
-            markets_list = [m for m in markets_list if m.get('type') == type]
-        if quote:
-            markets_list = [m for m in markets_list if m.get('quote') == quote]
+        # Apply all filters in one pass; the table only shows the first 50
+        # matches, so only those are kept and the rest are just counted
+        limit = None if format == 'json' else 50
+        markets_list = []
+        total_matched = 0
+        for m in all_markets:
+            if active and not m.get('active', True):
+                continue
+            if type and m.get('type') != type:
+                continue
+            if quote and m.get('quote') != quote:
+                continue
+            total_matched += 1
+            if limit is None or total_matched <= limit:
+                markets_list.append(m)
         
         if not markets_list:
             click.echo("No markets found matching the criteria.")
             return
         
         if format == 'json':
-            click.echo(json.dumps(markets_list, indent=2))
+            _echo_json(markets_list)
         else:
+            from tabulate import tabulate
+
             # Format as table
             headers = ['Symbol', 'Type', 'Base', 'Quote', 'Active', 'Min Amount', 'Min Cost']
-            rows = []
-            for market in markets_list[:50]:  # Limit to 50 for readability
-                rows.append([
+            rows = (
+                [
                     market['symbol'],
                     market.get('type', 'N/A'),
                     market.get('base', 'N/A'),
@@ -399,10 +786,12 @@ def markets(ctx, active, type, quote, format):
                     '✓' if market.get('active', True) else '✗',
                     f"{market.get('limits', {}).get('amount', {}).get('min', 'N/A')}",
                     f"{market.get('limits', {}).get('cost', {}).get('min', 'N/A')}"
-                ])
+                ]
+                for market in markets_list  # Limited to 50 for readability
+            )
             click.echo(tabulate(rows, headers=headers, tablefmt='grid'))
-            if len(markets_list) > 50:
-                click.echo(f"\n... and {len(markets_list) - 50} more markets")
+            if total_matched > limit:
+                click.echo(f"\n... and {total_matched - limit} more markets")
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
@@ -412,18 +801,32 @@ def markets(ctx, active, type, quote, format):
 @click.pass_context
 def info(ctx):
     """Show exchange information"""
-    client = ctx.obj['client']
     try:
-        exchange = client.exchange
-        click.echo(f"Exchange: {exchange.name}")
-        click.echo(f"Version: {exchange.version}")
-        click.echo(f"Rate Limit: {'Enabled' if exchange.enableRateLimit else 'Disabled'}")
-        click.echo(f"Has CORS: {exchange.has.get('CORS', False)}")
-        click.echo(f"Has Public API: {exchange.has.get('publicAPI', False)}")
-        click.echo(f"Has Private API: {exchange.has.get('privateAPI', False)}")
+        from dexcli import capabilities
+
+        # Prefer cached capabilities; build a client (and fill the cache) without them
+        exchange_name = ctx.obj.get('exchange_name', DEFAULT_EXCHANGE)
+        caps = capabilities.load(exchange_name)
+        if caps is None:
+            exchange = _get_client(ctx).exchange
+            caps = {'name': exchange.name, 'version': exchange.version, 'has': exchange.has}
+            capabilities.save(exchange_name, exchange)
+            rate_limit = exchange.enableRateLimit
+        else:
+            rate_limit = ctx.obj.get('enable_rate_limit',
+                                     not _env_flag('DEXCLI_DISABLE_RATELIMIT'))
+        has = caps['has']
+        lines = [
+            f"Exchange: {caps['name']}",
+            f"Version: {caps['version']}",
+            f"Rate Limit: {'Enabled' if rate_limit else 'Disabled'}",
+            f"Has CORS: {has.get('CORS', False)}",
+            f"Has Public API: {has.get('publicAPI', False)}",
+            f"Has Private API: {has.get('privateAPI', False)}",
+        ]
         
         # Show available features
-        click.echo("\nAvailable Features:")
+        lines.append("\nAvailable Features:")
         features = [
             ('Fetch Ticker', 'fetchTicker'),
             ('Fetch Tickers', 'fetchTickers'),
@@ -440,13 +843,28 @@ def info(ctx):
         ]
         
         for name, key in features:
-            supported = exchange.has.get(key, False)
+            supported = has.get(key, False)
             status = '✓' if supported else '✗'
-            click.echo(f"  {status} {name}")
+            lines.append(f"  {status} {name}")
+        click.echo('\n'.join(lines))
             
     except Exception as e:
         click.echo(f"Error: {str(e)}", err=True)
         sys.exit(1)
 
+# Standalone entrypoints (dexcli-status, dexcli-cancel) that run a single
+# command directly, skipping the group's dispatch
+def _run_standalone(command: click.Command, prog_name: str):
+    """Run one subcommand as its own program"""
+    _load_dotenv()
+    command.main(prog_name=prog_name,
+                 obj={'exchange_name': os.getenv('DEXCLI_EXCHANGE', DEFAULT_EXCHANGE)})
+
+def _status_main():
+    _run_standalone(status, 'dexcli-status')
+
+def _cancel_main():
+    _run_standalone(cancel, 'dexcli-cancel')
+
 if __name__ == '__main__':
     cli()
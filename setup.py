@@ -31,10 +31,13 @@ setup(
         "click>=8.0.0",
         "tabulate>=0.9.0",
         "python-dotenv>=0.19.0",
+        "orjson>=3.6.0",
     ],
     entry_points={
         "console_scripts": [
             "dexcli=dexcli.cli:cli",
+            "dexcli-status=dexcli.cli:_status_main",
+            "dexcli-cancel=dexcli.cli:_cancel_main",
         ],
     },
 )